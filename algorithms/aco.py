@@ -13,57 +13,95 @@ class AntColonyBalancer(LoadBalancer):
         self.q0 = q0                # Greedy selection probability (ACS style)
         self.tau_min = tau_min      # Lower pheromone bound
         self.tau_max = tau_max      # Upper pheromone bound
-        # Initialize trails in the middle of bounds
-        init_tau = min(max(1.0, tau_min), tau_max)
-        self.pheromones = np.full(self.num_vms, init_tau, dtype=float)
+        # Pheromones are stored lazily as tau_i = max(scale * raw_i, tau_min):
+        # evaporation only shrinks the scalar scale, and deposits touch a single
+        # raw entry. Because evaporation never raises a trail, tau_max only has
+        # to be enforced on deposit, and the tau_min clip can be applied on read.
+        # raw ** alpha and scale ** alpha are cached so no full-array power is
+        # needed per task (clipping commutes with the monotone power).
+        self._evap_pow = (1 - evap_rate) ** alpha
+        self._tau_min_pow = tau_min ** alpha
+        # Initialize trails in the middle of bounds (buffers allocated once)
+        self._init_tau = min(max(1.0, tau_min), tau_max)
+        self._pher_raw = np.empty(self.num_vms)
+        self._raw_alpha = np.empty(self.num_vms)
+        self._reset_pheromones(self._init_tau)
+        # Scratch buffer reused for per-task attraction values
+        self._attractions = np.empty(self.num_vms)
     
-    def assign_task(self, task, log_tasks=False):
+    @property
+    def pheromones(self):
+        """Effective (bounded) pheromone level on each VM."""
+        return np.maximum(self._pher_scale * self._pher_raw, self.tau_min)
+
+    def _reset_pheromones(self, tau):
+        """Sets every trail to tau and clears the lazy evaporation scale."""
+        self._pher_scale = 1.0
+        self._pher_scale_alpha = 1.0
+        self._pher_raw.fill(tau)
+        self._raw_alpha.fill(tau ** self.alpha)
+
+    def _renormalize_pheromones(self):
+        """Folds the evaporation scale back into the raw trails before it underflows."""
+        self._pher_raw *= self._pher_scale
+        np.maximum(self._pher_raw, self.tau_min, out=self._pher_raw)
+        np.power(self._pher_raw, self.alpha, out=self._raw_alpha)
+        self._pher_scale = 1.0
+        self._pher_scale_alpha = 1.0
+
+    def assign_task(self, task_length, log_tasks=False, task_id=None):
         """Assigns a task using online ACO logic."""
         
         # 1. Get Heuristic (Eta) - lower EFT is better, so eta = 1/EFT
-        efts = self._get_expected_finish_times(task)
-        # Add small epsilon to avoid division by zero
-        eta = 1.0 / (efts + 1e-6)
+        efts = self._get_expected_finish_times(task_length)
+        # eta ** beta == (EFT + eps) ** -beta: one power pass instead of a
+        # reciprocal followed by a power (eps avoids division by zero)
+        eta_beta = efts + 1e-6
+        np.power(eta_beta, -self.beta, out=eta_beta)
         
-        # 2. Compute attractions and choose VM (ACS rule)
-        attractions = (self.pheromones ** self.alpha) * (eta ** self.beta)
-        sum_attr = np.sum(attractions)
+        # 2. Compute attractions and choose VM (ACS rule), fused into one buffer
+        attractions = self._attractions
+        np.multiply(self._raw_alpha, self._pher_scale_alpha, out=attractions)
+        np.maximum(attractions, self._tau_min_pow, out=attractions)
+        attractions *= eta_beta
+        sum_attr = attractions.sum()
         if sum_attr <= 0 or not np.isfinite(sum_attr):
-            probabilities = np.ones(self.num_vms) / self.num_vms
-        else:
-            probabilities = attractions / sum_attr
+            # Degenerate weights: fall back to a uniform choice
+            attractions.fill(1.0)
+            sum_attr = float(self.num_vms)
 
-        if np.random.rand() < self.q0:
+        if self._uniform() < self.q0:
             # Greedy pick best attraction
-            chosen_vm_id = int(np.argmax(attractions))
+            chosen_vm_id = int(attractions.argmax())
         else:
-            # Roulette wheel sampling
-            chosen_vm_id = int(np.random.choice(self.num_vms, p=probabilities))
+            # Roulette wheel sampling on unnormalized weights
+            chosen_vm_id = self._sample_index(attractions)
         
         # --- Logging ---
         if log_tasks and len(self.log) < 50:
-            prob_str = probabilities[chosen_vm_id] if 'probabilities' in locals() else 1.0/self.num_vms
-            log_msg = f"Task {task['id']}: Chose VM {chosen_vm_id} (Prob: {prob_str:.3f})"
+            prob_str = attractions[chosen_vm_id] / sum_attr
+            log_msg = f"Task {task_id}: Chose VM {chosen_vm_id} (Prob: {prob_str:.3f})"
             self.log.append(log_msg)
         
         # --- Task Metrics ---
         task_finish_time = efts[chosen_vm_id]
-        self.task_log.append({"response_time": task_finish_time})
+        self._record_response_time(task_finish_time)
         # 4. Assign task
-        self.vm_loads[chosen_vm_id] += task['length']
+        self.vm_loads[chosen_vm_id] += task_length
 
         # 5. Update Pheromones
-        # a. Evaporation (element-wise) with lower bound
-        self.pheromones *= (1 - self.evap_rate)
-        self.pheromones = np.clip(self.pheromones, self.tau_min, self.tau_max)
+        # a. Evaporation: O(1) update of the lazy scale
+        self._pher_scale *= (1 - self.evap_rate)
+        self._pher_scale_alpha *= self._evap_pow
+        if min(self._pher_scale, self._pher_scale_alpha) < 1e-30:
+            self._renormalize_pheromones()
         
         # b. Deposit on chosen VM; scale by inverse time
         deposit_amount = 1.0 / (task_finish_time + 1e-6)
-        self.pheromones[chosen_vm_id] = np.clip(
-            self.pheromones[chosen_vm_id] + deposit_amount,
-            self.tau_min,
-            self.tau_max
-        )
+        tau = max(self._pher_scale * self._pher_raw[chosen_vm_id], self.tau_min)
+        tau = min(max(tau + deposit_amount, self.tau_min), self.tau_max)
+        self._pher_raw[chosen_vm_id] = tau / self._pher_scale
+        self._raw_alpha[chosen_vm_id] = self._pher_raw[chosen_vm_id] ** self.alpha
 
         # Return selected VM id for external simulators (e.g., SimPy)
         return chosen_vm_id
@@ -72,7 +110,6 @@ class AntColonyBalancer(LoadBalancer):
         """Runs the ACO simulation for all tasks."""
         self.reset()
         # Reset pheromones for a fresh simulation
-        self.pheromones = np.ones(self.num_vms)
-        for task in tasks:
-            self.assign_task(task, log_tasks)
+        self._reset_pheromones(self._init_tau)
+        self.assign_batch(tasks, log_tasks)
         return self.get_vm_finish_times()
\ No newline at end of file
@@ -1,38 +1,133 @@
 import numpy as np
 
+def _arrays_from_vms(vms):
+    """
+    Converts a list of VM dicts (array-of-structs) into per-attribute
+    float64 arrays (struct-of-arrays): mips, p_max, p_idle.
+    Structured VM arrays (entities.create_vms) are copied column-wise.
+    """
+    if isinstance(vms, np.ndarray):
+        return tuple(vms[field].astype(np.float64) for field in ("mips", "p_max", "p_idle"))
+    mips = np.array([vm["mips"] for vm in vms], dtype=np.float64)
+    p_max = np.array([vm["p_max"] for vm in vms], dtype=np.float64)
+    p_idle = np.array([vm["p_idle"] for vm in vms], dtype=np.float64)
+    return mips, p_max, p_idle
+
 class LoadBalancer:
     """
     Base class for load balancing algorithms.
     """
+    RNG_BATCH = 1024 # Uniform samples drawn per call into NumPy's global RNG
+
     def __init__(self, vms):
         self.vms = vms
         self.num_vms = len(vms)
+        # Per-VM attributes cached as arrays (SoA) for vectorized math
+        self.mips, self.p_max, self.p_idle = _arrays_from_vms(vms)
+        # 1/MIPS, inf where a VM has no capacity
+        with np.errstate(divide='ignore'):
+            self.inv_mips = np.where(self.mips > 0, 1.0 / self.mips, np.inf)
+        # Same, but 0 for zero-capacity VMs: turns loads into finish times
+        self._finish_scale = np.where(self.mips > 0, self.inv_mips, 0.0)
         # vm_loads stores the total MI assigned to each VM
         self.vm_loads = np.zeros(self.num_vms)
+        # Scratch buffer for cumulative weights used in roulette sampling
+        self._cdf = np.empty(self.num_vms)
         self.log = [] # Add log to store assignment decisions
-        self.task_log = [] # Stores detailed task metrics
+        # Per-task response times, stored in a growable array (see task_log)
+        self._response_times = np.empty(0)
+        self._num_recorded = 0
+        # Pre-drawn U[0,1) samples, consumed one per random decision
+        self._uniforms = []
     
-    def get_vm_finish_times(self):
-        """Calculates the finish time for each VM."""
-        finish_times = np.zeros(self.num_vms)
-        for i in range(self.num_vms):
-            if self.vms[i]["mips"] > 0:
-                finish_times[i] = self.vm_loads[i] / self.vms[i]["mips"]
-        return finish_times
-
-    def _get_expected_finish_times(self, task):
-        """Calculates the raw expected finish time for a task on all VMs."""
-        efts = np.zeros(self.num_vms)
-        for i in range(self.num_vms):
-            vm = self.vms[i]
-            if vm["mips"] > 0:
-                efts[i] = (self.vm_loads[i] + task['length']) / vm["mips"]
-            else:
-                efts[i] = float('inf')
-        return efts
+    def get_vm_finish_times(self, out=None):
+        """
+        Calculates the finish time for each VM, into `out` if given
+        (a reusable buffer) instead of a new array.
+        """
+        # Zero-capacity VMs report 0 rather than 0 * inf = nan
+        return np.multiply(self.vm_loads, self._finish_scale, out=out)
+
+    @staticmethod
+    def _task_lengths(tasks):
+        """
+        Extracts task lengths (MI) into a float array, once per simulation.
+        Structured task arrays (entities.create_tasks) are read column-wise.
+        """
+        if isinstance(tasks, np.ndarray):
+            return tasks['length'].astype(np.float64)
+        return np.fromiter((t['length'] for t in tasks), dtype=np.float64, count=len(tasks))
+
+    @staticmethod
+    def _task_ids(tasks):
+        """Task ids as a list of ints, read column-wise from structured task arrays."""
+        if isinstance(tasks, np.ndarray):
+            return tasks['id'].tolist()
+        return [t['id'] for t in tasks]
+
+    def _get_expected_finish_times(self, task_length):
+        """Calculates the raw expected finish time for a task of the given length (MI) on all VMs."""
+        return (self.vm_loads + task_length) * self.inv_mips
+
+    def _expected_finish_time(self, vm_id, task_length):
+        """Expected finish time of a task on a single VM (scalar form of the above)."""
+        return (self.vm_loads[vm_id] + task_length) * self.inv_mips[vm_id]
+
+    def _uniform(self):
+        """Returns one U[0,1) sample, refilling the batch from np.random when empty."""
+        if not self._uniforms:
+            self._uniforms = np.random.random(self.RNG_BATCH).tolist()
+        return self._uniforms.pop()
+
+    def _sample_index(self, weights):
+        """Roulette-wheel sample an index proportional to (unnormalized) weights."""
+        weights.cumsum(out=self._cdf)
+        idx = int(self._cdf.searchsorted(self._uniform() * self._cdf[-1], side='right'))
+        return min(idx, self.num_vms - 1) # Guard against float round-off at the top end
+
+    @property
+    def task_response_times(self):
+        """Response times of the tasks assigned since the last reset, as an array."""
+        return self._response_times[:self._num_recorded]
+
+    @property
+    def task_log(self):
+        """Detailed task metrics as a list of dicts (built on demand)."""
+        return [{"response_time": rt} for rt in self.task_response_times.tolist()]
+
+    def _reserve_tasks(self, num_tasks):
+        """Ensures room for num_tasks more response times without reallocating."""
+        needed = self._num_recorded + num_tasks
+        if needed > len(self._response_times):
+            grown = np.empty(max(needed, 2 * len(self._response_times)))
+            grown[:self._num_recorded] = self.task_response_times
+            self._response_times = grown
+
+    def _record_response_time(self, response_time):
+        """Stores one task's response time."""
+        if self._num_recorded == len(self._response_times):
+            self._reserve_tasks(max(self._num_recorded, 64))
+        self._response_times[self._num_recorded] = response_time
+        self._num_recorded += 1
 
     def reset(self):
-        """Resets the VM loads for a new simulation."""
-        self.vm_loads = np.zeros(self.num_vms)
+        """Resets the VM loads for a new simulation (buffers are reused)."""
+        self.vm_loads.fill(0.0)
         self.log = [] # Reset log
-        self.task_log = [] # Reset task log
\ No newline at end of file
+        self._num_recorded = 0 # Reset task metrics (buffer is reused)
+        self._uniforms.clear() # Seeded runs must not depend on leftover samples
+
+    def assign_batch(self, tasks, log_tasks=False):
+        """
+        Assigns all tasks in order and returns the chosen VM id per task.
+        Defaults to one assign_task call per task (each choice depends on the
+        loads left by the previous one); stateless policies override this
+        with array operations.
+        """
+        lengths = self._task_lengths(tasks)
+        task_ids = self._task_ids(tasks) if log_tasks else [None] * len(lengths)
+        self._reserve_tasks(len(lengths))
+        return np.fromiter(
+            (self.assign_task(task_length, log_tasks, task_id) for task_id, task_length in zip(task_ids, lengths)),
+            dtype=np.int64, count=len(lengths),
+        )
@@ -1,63 +1,63 @@
-import random
 import numpy as np
 from .base import LoadBalancer
 
 class RockHyraxBalancer(LoadBalancer):
     """
     Implements the Rock Hyrax Optimization (RHO) load balancing algorithm.
+
+    Two selection strategies are supported:
+    - 'softmax':  temperature-controlled softmax sampling over fitness (default)
+    - 'discrete': the paper's phase branches (exploration picks a random VM or
+                  the alpha, exploitation always picks the alpha), as used by
+                  the frontend simulator
     """
-    def __init__(self, vms, w1=0.7, w2=0.3):
+    STRATEGIES = ('softmax', 'discrete')
+
+    def __init__(self, vms, w1=0.7, w2=0.3, strategy='softmax'):
         super().__init__(vms)
         self.w1 = w1 # Weight for time (Makespan/Response)
         self.w2 = w2 # Weight for energy
-
-    def _get_fitness_scores(self, task):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown RHO strategy '{strategy}'; expected one of {self.STRATEGIES}")
+        self.strategy = strategy
+        # Bind the selection rule once so assign_task does not branch per task
+        self._choose_vm = self._choose_softmax if strategy == 'softmax' else self._choose_discrete
+        # Energy per MI on each VM (P_max / MIPS); only task length varies per task
+        with np.errstate(divide='ignore'):
+            self._energy_per_mi = np.where(self.mips > 0, self.p_max / self.mips, np.inf)
+        # Scratch buffers reused for per-task energy costs and softmax weights
+        self._energy_costs = np.empty(self.num_vms)
+        self._softmax = np.empty(self.num_vms)
+
+    def _get_fitness_scores(self, task_length):
         """
         Calculates the fitness for all VMs based on the paper's
         multi-objective approach (Eq. 5).
         
         Fitness = w1 * Time_Cost + w2 * Energy_Cost
         """
-        fitness_scores = np.zeros(self.num_vms)
-
-        # 1) Time cost: expected finish time if assigning this task now (s)
-        raw_time_costs = self._get_expected_finish_times(task)
+        # 1) Time cost: expected finish time if assigning this task now (s).
+        #    This is a fresh array, so it is normalized in place below.
+        time_costs = self._get_expected_finish_times(task_length)
 
         # 2) Energy cost: incremental energy to execute THIS task on VM i
         #    E_task(i) ≈ P_max(i) * service_time(i), service_time = length / mips
-        raw_energy_costs = np.zeros(self.num_vms)
-        for i in range(self.num_vms):
-            vm = self.vms[i]
-            mips = vm.get("mips", 0)
-            if mips > 0:
-                service_time = task['length'] / mips
-                raw_energy_costs[i] = vm["p_max"] * service_time
-            else:
-                raw_energy_costs[i] = float('inf')
-
-        # 3) Normalize costs (min-max) into [0,1]
-        min_time, max_time = np.min(raw_time_costs), np.max(raw_time_costs)
-        min_energy, max_energy = np.min(raw_energy_costs), np.max(raw_energy_costs)
+        energy_costs = np.multiply(self._energy_per_mi, task_length, out=self._energy_costs)
 
-        norm_time = (raw_time_costs - min_time) / (max_time - min_time + 1e-9)
-        norm_energy = (raw_energy_costs - min_energy) / (max_energy - min_energy + 1e-9)
+        # 3) Normalize costs (min-max) into [0,1] and apply weights, in place
+        time_costs -= time_costs.min()
+        time_costs *= self.w1 / (time_costs.max() + 1e-9)
+        energy_costs -= energy_costs.min()
+        energy_costs *= self.w2 / (energy_costs.max() + 1e-9)
 
         # 4) Weighted fitness (lower is better)
-        fitness_scores = (self.w1 * norm_time) + (self.w2 * norm_energy)
-        return fitness_scores
-
-    def assign_task(self, task, log_tasks=False):
-        """
-        Assigns a single task using the RHO logic (Phases 1 and 2).
-        """
-        # Calculate fitness for all VMs
-        fitness_scores = self._get_fitness_scores(task)
-
-        # Identify Alpha (best current VM)
-        alpha_vm_id = int(np.argmin(fitness_scores))
+        time_costs += energy_costs
+        return time_costs
 
+    def _choose_softmax(self, fitness_scores, alpha_vm_id, alpha_fitness, write_log):
+        """Phase-dependent temperature, then a softmax sample over negative fitness."""
         # Exploration vs Exploitation via temperature-controlled softmax
-        r = random.random()
+        r = self._uniform()
         if r < 0.5:
             phase = "Phase 1 (Exploration)"
             temperature = 1.0  # high temp => more uniform probabilities
@@ -65,30 +65,68 @@ class RockHyraxBalancer(LoadBalancer):
             phase = "Phase 2 (Exploitation)"
             temperature = 0.2  # low temp => focus on best (alpha)
 
-        # Stable softmax over negative fitness (lower fitness => higher prob)
-        scores = -fitness_scores / max(temperature, 1e-9)
-        scores -= np.max(scores)  # numerical stability
-        exps = np.exp(scores)
-        probs = exps / (np.sum(exps) + 1e-12)
+        # Stable softmax over negative fitness (lower fitness => higher prob).
+        # The max score is the alpha's, so shifting by it is (alpha_fit - fit) / T;
+        # computed in place in a reused buffer.
+        exps = self._softmax
+        np.subtract(alpha_fitness, fitness_scores, out=exps)
+        exps *= 1.0 / max(temperature, 1e-9)
+        np.exp(exps, out=exps)
+
+        # Draw VM from the unnormalized softmax weights (inverse-CDF sampling)
+        chosen_vm_id = self._sample_index(exps)
+
+        if not write_log:
+            return chosen_vm_id, None
+        return chosen_vm_id, (
+            f"{phase} (Softmax sample (T={temperature:.2f})). "
+            f"-> Assigned to VM {chosen_vm_id} (p={exps[chosen_vm_id] / exps.sum():.3f})"
+        )
+
+    def _choose_discrete(self, fitness_scores, alpha_vm_id, alpha_fitness, write_log):
+        """Phase 1 explores (random VM or alpha, 50/50); Phase 2 exploits the alpha."""
+        if self._uniform() < 0.5:
+            phase = "Phase 1 (Exploration)"
+            if self._uniform() < 0.5:
+                chosen_vm_id = min(int(self._uniform() * self.num_vms), self.num_vms - 1)
+                reason = "Random VM"
+            else:
+                chosen_vm_id = alpha_vm_id
+                reason = "Move to Alpha"
+        else:
+            phase = "Phase 2 (Exploitation)"
+            chosen_vm_id = alpha_vm_id
+            reason = "Exploit Alpha"
+
+        if not write_log:
+            return chosen_vm_id, None
+        return chosen_vm_id, f"{phase} ({reason}). -> Assigned to VM {chosen_vm_id}"
+
+    def assign_task(self, task_length, log_tasks=False, task_id=None):
+        """
+        Assigns a single task using the RHO logic (Phases 1 and 2).
+        """
+        # Calculate fitness for all VMs
+        fitness_scores = self._get_fitness_scores(task_length)
+
+        # Identify Alpha (best current VM)
+        alpha_vm_id = int(fitness_scores.argmin()) # ndarray method: no np.* dispatch overhead
+        alpha_fitness = fitness_scores[alpha_vm_id]
 
-        # Draw VM; ensure at least some chance for alpha in exploration, too
-        chosen_vm_id = int(np.random.choice(self.num_vms, p=probs))
-        log_reason = f"Softmax sample (T={temperature:.2f})"
+        # Pick a VM with the configured strategy (log detail only built when needed)
+        write_log = log_tasks and len(self.log) < 50
+        chosen_vm_id, log_detail = self._choose_vm(fitness_scores, alpha_vm_id, alpha_fitness, write_log)
 
         # Logging (first 50 tasks)
-        if log_tasks and len(self.log) < 50:
-            log_msg = (
-                f"Task {task['id']}: Alpha VM={alpha_vm_id} (Fit: {fitness_scores[alpha_vm_id]:.3f}). "
-                f"{phase} ({log_reason}). -> Assigned to VM {chosen_vm_id} (p={probs[chosen_vm_id]:.3f})"
-            )
-            self.log.append(log_msg)
+        if write_log:
+            self.log.append(f"Task {task_id}: Alpha VM={alpha_vm_id} (Fit: {alpha_fitness:.3f}). {log_detail}")
 
         # Task metrics based on expected finish time at decision time
-        eft = self._get_expected_finish_times(task)[chosen_vm_id]
-        self.task_log.append({"response_time": eft})
+        eft = self._expected_finish_time(chosen_vm_id, task_length)
+        self._record_response_time(eft)
 
         # Update VM load (sum of MI assigned)
-        self.vm_loads[chosen_vm_id] += task['length']
+        self.vm_loads[chosen_vm_id] += task_length
 
         # Return chosen VM id for SimPy integration
         return chosen_vm_id
@@ -96,6 +134,5 @@ class RockHyraxBalancer(LoadBalancer):
     def simulate(self, tasks, log_tasks=False):
         """Runs the RHO simulation for all tasks."""
         self.reset()
-        for task in tasks:
-            self.assign_task(task, log_tasks)
+        self.assign_batch(tasks, log_tasks)
         return self.get_vm_finish_times()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 from .base import LoadBalancer
 
 class RoundRobinBalancer(LoadBalancer):
@@ -9,27 +10,25 @@ class RoundRobinBalancer(LoadBalancer):
         super().__init__(vms)
         self.rr_counter = 0 # Round Robin counter
     
-    def assign_task(self, task, log_tasks=False):
+    def assign_task(self, task_length, log_tasks=False, task_id=None):
         """Assigns a task using Round Robin logic."""
         # Get the next VM in the cycle
         chosen_vm_id = self.rr_counter % self.num_vms
         
         # --- Logging ---
         if log_tasks and len(self.log) < 50: # Log first 50 tasks
-            log_msg = f"Task {task['id']}: Assigned to VM {chosen_vm_id} (Round Robin cycle)"
+            log_msg = f"Task {task_id}: Assigned to VM {chosen_vm_id} (Round Robin cycle)"
             self.log.append(log_msg)
         # --- End Logging ---
         
         # --- Task Metrics ---
-        eft = self._get_expected_finish_times(task)[chosen_vm_id]
+        eft = self._expected_finish_time(chosen_vm_id, task_length)
         
-        self.task_log.append({
-            "response_time": eft # Since AT=0, RT = FT
-        })
+        self._record_response_time(eft) # Since AT=0, RT = FT
         # --- End Task Metrics ---
 
         # Assign the task and update the load
-        self.vm_loads[chosen_vm_id] += task['length']
+        self.vm_loads[chosen_vm_id] += task_length
         
         # Increment the counter for the next task
         self.rr_counter += 1
@@ -37,9 +36,37 @@ class RoundRobinBalancer(LoadBalancer):
         # Return selected VM id for external simulators (e.g., SimPy)
         return chosen_vm_id
         
+    def assign_batch(self, tasks, log_tasks=False):
+        """
+        Assigns all tasks using Round Robin logic.
+        The cyclic assignment does not depend on VM state, so the whole batch
+        is computed with array operations instead of a per-task loop.
+        """
+        lengths = self._task_lengths(tasks)
+        num_tasks = len(lengths)
+        assignments = (self.rr_counter + np.arange(num_tasks)) % self.num_vms
+
+        # --- Logging ---
+        if log_tasks:
+            for i in range(min(num_tasks, 50 - len(self.log))):
+                self.log.append(f"Task {tasks[i]['id']}: Assigned to VM {assignments[i]} (Round Robin cycle)")
+
+        # --- Task Metrics ---
+        # Each VM's EFT sequence is the running sum of its own task lengths
+        self._reserve_tasks(num_tasks)
+        response_times = self._response_times[self._num_recorded:self._num_recorded + num_tasks]
+        for vm_id in range(self.num_vms):
+            mask = assignments == vm_id
+            response_times[mask] = (self.vm_loads[vm_id] + np.cumsum(lengths[mask])) * self.inv_mips[vm_id]
+        self._num_recorded += num_tasks
+
+        # Assign all tasks and advance the cycle
+        self.vm_loads += np.bincount(assignments, weights=lengths, minlength=self.num_vms)
+        self.rr_counter = (self.rr_counter + num_tasks) % self.num_vms
+        return assignments
+
     def simulate(self, tasks, log_tasks=False):
         """Runs the Round Robin simulation for all tasks."""
         self.reset()
-        for task in tasks:
-            self.assign_task(task, log_tasks)
-        return self.get_vm_finish_times()
\ No newline at end of file
+        self.assign_batch(tasks, log_tasks)
+        return self.get_vm_finish_times()
@@ -1,29 +1,50 @@
-import boto3
-from typing import Dict, Any, Optional
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
 
-def _get_session(profile_name: Optional[str] = None, region_name: Optional[str] = None) -> boto3.session.Session:
-    if profile_name or region_name:
-        return boto3.Session(profile_name=profile_name, region_name=region_name)
-    return boto3.Session()
+from aws_utils import BOTO_CONFIG, get_session
 
 
-def _normalize(values: Dict[str, float], higher_is_better: bool) -> Dict[str, float]:
-    if not values:
-        return {}
-    v_list = list(values.values())
-    v_min = min(v_list)
-    v_max = max(v_list)
-    if v_max == v_min:
-        # If all equal, give full credit
-        return {k: 1.0 for k in values}
-    norm: Dict[str, float] = {}
-    for k, v in values.items():
-        if higher_is_better:
-            norm[k] = (v - v_min) / (v_max - v_min)
-        else:
-            norm[k] = (v_max - v) / (v_max - v_min)
-    return norm
+@functools.lru_cache(maxsize=8)
+def _get_client(profile_name: Optional[str] = None, region_name: Optional[str] = None):
+    """CloudWatch client per (profile, region), created once and reused across runs."""
+    return get_session(profile_name, region_name).client('cloudwatch', config=BOTO_CONFIG)
+
+
+# (final_metrics key, CloudWatch metric name, unit) published per algorithm.
+# CloudWatch doesn't support a Kilojoules unit, so energy is published unitless.
+_PUBLISHED_METRICS = (
+    ('AvgResponseTime_s', 'AverageResponseTime', 'Seconds'),
+    ('Makespan_s', 'Makespan', 'Seconds'),
+    ('Throughput_task_s', 'Throughput', 'Count/Second'),
+    ('TotalEnergy_kJ', 'TotalEnergy', None),
+)
+
+# (metric key, higher_is_better, base weight) used for the PerformanceScore
+_SCORE_METRICS = (
+    ('AvgResponseTime_s', False, 0.5),
+    ('Throughput_task_s', True, 0.3),
+    ('TotalEnergy_kJ', False, 0.2),
+)
+
+
+def _normalize(mat: np.ndarray, higher_is_better: np.ndarray) -> np.ndarray:
+    """
+    Min-max normalize each row of a (metrics, algorithms) matrix into [0,1],
+    flipping rows where lower is better. NaN marks a missing value and maps to 0;
+    a row whose present values are all equal gets full credit.
+    """
+    present = ~np.isnan(mat)
+    filled_lo = np.where(present, mat, np.inf).min(axis=1, keepdims=True)
+    filled_hi = np.where(present, mat, -np.inf).max(axis=1, keepdims=True)
+    span = filled_hi - filled_lo
+    with np.errstate(invalid='ignore', divide='ignore'):
+        norm = np.where(higher_is_better[:, None], mat - filled_lo, filled_hi - mat) / span
+    norm = np.where(span == 0, 1.0, norm)
+    return np.where(present, norm, 0.0)
 
 
 def _compute_performance_scores(final_metrics: Dict[str, Dict[str, float]]) -> Dict[str, float]:
@@ -34,120 +55,38 @@ def _compute_performance_scores(final_metrics: Dict[str, Dict[str, float]]) -> D
     - TotalEnergy_kJ (lower is better) weight 0.2
     If a metric is missing, its weight is ignored and remaining weights are renormalized.
     """
-    # Collect metric maps per algorithm
-    resp = {}
-    thr = {}
-    energy = {}
-    for algo, mets in final_metrics.items():
-        if 'AvgResponseTime_s' in mets:
-            resp[algo] = float(mets['AvgResponseTime_s'])
-        if 'Throughput_task_s' in mets:
-            thr[algo] = float(mets['Throughput_task_s'])
-        if 'TotalEnergy_kJ' in mets:
-            energy[algo] = float(mets['TotalEnergy_kJ'])
-
-    # Base weights
-    w_resp, w_thr, w_energy = 0.5, 0.3, 0.2
-    active_weights = []
-    if resp:
-        active_weights.append(w_resp)
-    else:
-        w_resp = 0.0
-    if thr:
-        active_weights.append(w_thr)
-    else:
-        w_thr = 0.0
-    if energy:
-        active_weights.append(w_energy)
-    else:
-        w_energy = 0.0
-    denom = sum(active_weights) or 1.0
-    # Renormalize
-    w_resp /= denom
-    w_thr /= denom
-    w_energy /= denom
-
-    resp_n = _normalize(resp, higher_is_better=False) if resp else {}
-    thr_n = _normalize(thr, higher_is_better=True) if thr else {}
-    energy_n = _normalize(energy, higher_is_better=False) if energy else {}
-
-    algos = set(final_metrics.keys())
-    scores: Dict[str, float] = {}
-    for a in algos:
-        s = 0.0
-        if resp_n:
-            s += w_resp * resp_n.get(a, 0.0)
-        if thr_n:
-            s += w_thr * thr_n.get(a, 0.0)
-        if energy_n:
-            s += w_energy * energy_n.get(a, 0.0)
-        scores[a] = 100.0 * s
-    return scores
+    algos = list(final_metrics.keys())
+    if not algos:
+        return {}
 
+    # (metrics, algorithms) matrix; NaN where an algorithm lacks a metric
+    mat = np.array([
+        [float(final_metrics[a].get(key, np.nan)) for a in algos]
+        for key, _, _ in _SCORE_METRICS
+    ])
+    higher_is_better = np.array([hib for _, hib, _ in _SCORE_METRICS])
+    weights = np.array([w for _, _, w in _SCORE_METRICS])
 
-def publish_metrics_and_dashboard(
-    run_id: str,
-    final_metrics: Dict[str, Dict[str, Any]],
-    profile_name: Optional[str] = None,
-    region_name: Optional[str] = None,
-    namespace: str = 'LoadBalancerMetrics',
-):
-    """
-    Publish summary metrics for each algorithm to CloudWatch and create a
-    comparison dashboard. Expects final_metrics like:
-      {
-        'Round Robin': {'AvgResponseTime_s': ..., 'Throughput_task_s': ..., 'TotalEnergy_kJ': ..., 'Makespan_s': ...},
-        'RHO': {...},
-        'ACO': {...}
-      }
-    """
-    session = _get_session(profile_name, region_name)
-    cw = session.client('cloudwatch')
+    # Renormalize over metrics reported by at least one algorithm
+    active = ~np.isnan(mat).all(axis=1)
+    weights = np.where(active, weights, 0.0)
+    weights /= weights.sum() or 1.0
 
-    # Compute PerformanceScore per algorithm
-    perf_scores = _compute_performance_scores(final_metrics)
+    scores = 100.0 * (weights @ _normalize(mat, higher_is_better))
+    return dict(zip(algos, scores.tolist()))
 
-    # Prepare metric data
-    metric_data = []
-    def add_metric(algo: str, name: str, value: float, unit: str | None = None):
-        datum = {
-            'MetricName': name,
-            'Dimensions': [
-                {'Name': 'Algorithm', 'Value': algo},
-                {'Name': 'RunID', 'Value': run_id},
-            ],
-            'Value': float(value),
-        }
-        if unit:
-            datum['Unit'] = unit
-        metric_data.append(datum)
-
-    for algo, mets in final_metrics.items():
-        if 'AvgResponseTime_s' in mets:
-            add_metric(algo, 'AverageResponseTime', mets['AvgResponseTime_s'], 'Seconds')
-        if 'Makespan_s' in mets:
-            add_metric(algo, 'Makespan', mets['Makespan_s'], 'Seconds')
-        if 'Throughput_task_s' in mets:
-            # tasks per second
-            add_metric(algo, 'Throughput', mets['Throughput_task_s'], 'Count/Second')
-        if 'TotalEnergy_kJ' in mets:
-            # CloudWatch doesn't support a Kilojoules unit; publish as unitless
-            add_metric(algo, 'TotalEnergy', mets['TotalEnergy_kJ'], None)
-        if algo in perf_scores:
-            add_metric(algo, 'PerformanceScore', perf_scores[algo], 'Percent')
-
-    # Put metrics in batches of 20 (CloudWatch limit per call)
-    for i in range(0, len(metric_data), 20):
-        batch = metric_data[i:i+20]
-        if batch:
-            cw.put_metric_data(Namespace=namespace, MetricData=batch)
-
-    # Build a comparison dashboard
-    region = cw.meta.region_name
-    algos = list(final_metrics.keys())
 
+_RUN_ID_PLACEHOLDER = '{RUN_ID}'
+
+
+@functools.lru_cache(maxsize=32)
+def _dashboard_template(algos: Tuple[str, ...], region: str, namespace: str) -> str:
+    """
+    Serialized comparison dashboard for an algorithm set, with a placeholder
+    in place of the RunID. Cached so repeated runs only substitute the RunID.
+    """
     def metric_rows(metric_name: str):
-        return [[namespace, metric_name, 'Algorithm', a, 'RunID', run_id] for a in algos]
+        return [[namespace, metric_name, 'Algorithm', a, 'RunID', _RUN_ID_PLACEHOLDER] for a in algos]
 
     dashboard = {
         'widgets': [
@@ -190,9 +129,72 @@ def publish_metrics_and_dashboard(
         ]
     }
 
+    return json.dumps(dashboard)
+
+
+def publish_metrics_and_dashboard(
+    run_id: str,
+    final_metrics: Dict[str, Dict[str, Any]],
+    profile_name: Optional[str] = None,
+    region_name: Optional[str] = None,
+    namespace: str = 'LoadBalancerMetrics',
+):
+    """
+    Publish summary metrics for each algorithm to CloudWatch and create a
+    comparison dashboard. Expects final_metrics like:
+      {
+        'Round Robin': {'AvgResponseTime_s': ..., 'Throughput_task_s': ..., 'TotalEnergy_kJ': ..., 'Makespan_s': ...},
+        'RHO': {...},
+        'ACO': {...}
+      }
+    """
+    cw = _get_client(profile_name, region_name)
+
+    # Compute PerformanceScore per algorithm
+    perf_scores = _compute_performance_scores(final_metrics)
+
+    # Prepare metric data: one datum per (algorithm, published metric)
+    def datum(algo: str, name: str, value: float, unit: Optional[str]) -> Dict[str, Any]:
+        d = {
+            'MetricName': name,
+            'Dimensions': [
+                {'Name': 'Algorithm', 'Value': algo},
+                {'Name': 'RunID', 'Value': run_id},
+            ],
+            'Value': float(value),
+            # Standard (60s) resolution, stated explicitly so summary metrics
+            # are never billed as high-resolution custom metrics
+            'StorageResolution': 60,
+        }
+        if unit:
+            d['Unit'] = unit
+        return d
+
+    metric_data = [
+        datum(algo, name, mets[key], unit)
+        for algo, mets in final_metrics.items()
+        for key, name, unit in _PUBLISHED_METRICS
+        if key in mets
+    ]
+    metric_data += [datum(algo, 'PerformanceScore', score, 'Percent') for algo, score in perf_scores.items()]
+
+    # Put metrics in batches of 20 (CloudWatch limit per call), sent concurrently;
+    # boto3 clients are thread-safe and each call is network-bound
+    batches = [metric_data[i:i+20] for i in range(0, len(metric_data), 20)]
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(8, len(batches))) as pool:
+            list(pool.map(lambda batch: cw.put_metric_data(Namespace=namespace, MetricData=batch), batches))
+
+    # Build a comparison dashboard (cached skeleton, RunID substituted per run;
+    # json.dumps on the RunID keeps the substitution JSON-safe)
+    region = cw.meta.region_name
+    body = _dashboard_template(tuple(final_metrics.keys()), region, namespace).replace(
+        _RUN_ID_PLACEHOLDER, json.dumps(run_id)[1:-1]
+    )
+
     cw.put_dashboard(
         DashboardName=f'Load_Balancer_Comparison_{run_id}',
-        DashboardBody=__import__('json').dumps(dashboard)
+        DashboardBody=body
     )
 
     return {
@@ -1,22 +1,53 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
-import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
 
-# Reuse the existing plotting helpers
+# Reuse the existing plotting helpers and AWS client configuration
 import plotting
+from aws_utils import BOTO_CONFIG, TTL_ATTRIBUTE, decode_vm_times, get_session
 
 
 def _to_float(v):
-    """Convert DynamoDB Decimals (and nested structures) to Python floats."""
-    if isinstance(v, Decimal):
-        return float(v)
-    if isinstance(v, dict):
-        return {k: _to_float(x) for k, x in v.items()}
-    if isinstance(v, (list, tuple)):
-        return [_to_float(x) for x in v]
-    return v
+    """
+    Convert DynamoDB Decimals (and nested structures) to Python floats.
+    Walks containers with an explicit stack instead of recursing per element.
+    """
+    def convert(x):
+        # Returns the converted leaf, or an empty shell for a container
+        if isinstance(x, Decimal):
+            return float(x)
+        if isinstance(x, dict):
+            return {}
+        if isinstance(x, (list, tuple)):
+            return []
+        return x
+
+    root = convert(v)
+    stack = [(v, root)] if isinstance(v, (dict, list, tuple)) else []
+    while stack:
+        src, dst = stack.pop()
+        pairs = src.items() if isinstance(src, dict) else enumerate(src)
+        for k, x in pairs:
+            out = convert(x)
+            if isinstance(dst, dict):
+                dst[k] = out
+            else:
+                dst.append(out)
+            if out is not x and isinstance(out, (dict, list)):
+                stack.append((x, out))
+    return root
+
+
+def _query_all(table, **query_kwargs):
+    """Run a DynamoDB query and follow LastEvaluatedKey until all pages are read."""
+    resp = table.query(**query_kwargs)
+    items = resp.get("Items", [])
+    while "LastEvaluatedKey" in resp:
+        resp = table.query(ExclusiveStartKey=resp["LastEvaluatedKey"], **query_kwargs)
+        items.extend(resp.get("Items", []))
+    return items
 
 
 def fetch_experiment_results(table, run_id: str):
@@ -31,18 +62,30 @@ def fetch_experiment_results(table, run_id: str):
       ...
     }
     """
-    # Query all items under the partition key
-    resp = table.query(
-        KeyConditionExpression=Key("RunID").eq(run_id)
-    )
-
-    items = resp.get("Items", [])
-    while "LastEvaluatedKey" in resp:
-        resp = table.query(
-            KeyConditionExpression=Key("RunID").eq(run_id),
-            ExclusiveStartKey=resp["LastEvaluatedKey"],
+    # Two queries run concurrently, both filtered server-side so unused items
+    # (notably the AssignmentLog-* text logs) never cross the wire:
+    #  - FinalTimes-* items via a sort-key prefix condition, projected to the
+    #    attributes read below
+    #  - metrics and params items, excluding FinalTimes-*/AssignmentLog-*
+    run_key = Key("RunID").eq(run_id)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        final_times_items = pool.submit(
+            _query_all,
+            table,
+            KeyConditionExpression=run_key & Key("AlgorithmTaskCount").begins_with("FinalTimes-"),
+            ProjectionExpression="AlgorithmTaskCount, Algorithm, TaskCount, VmFinishTimes, VmFinishTimesEncoding",
         )
-        items.extend(resp.get("Items", []))
+        other_items = pool.submit(
+            _query_all,
+            table,
+            KeyConditionExpression=run_key,
+            FilterExpression=(
+                ~Attr("AlgorithmTaskCount").begins_with("FinalTimes-")
+                & ~Attr("AlgorithmTaskCount").begins_with("AssignmentLog-")
+            ),
+        )
+        # Params first so max_tasks from the configured steps takes precedence
+        items = other_items.result() + final_times_items.result()
 
     results = {}
     final_times = {}
@@ -67,7 +110,7 @@ def fetch_experiment_results(table, run_id: str):
         # Final per-VM times
         if isinstance(sort_key, str) and sort_key.startswith("FinalTimes-"):
             if algo and "VmFinishTimes" in it:
-                final_times[algo] = [_to_float(x) for x in it["VmFinishTimes"]]
+                final_times[algo] = decode_vm_times(it)
             if max_tasks is None and "TaskCount" in it:
                 try:
                     max_tasks = int(it["TaskCount"])
@@ -79,10 +122,10 @@ def fetch_experiment_results(table, run_id: str):
         if task_count is None or not algo:
             continue
 
-        # Collect metrics: everything that is a number except keys
+        # Collect metrics: everything that is a number except keys (and the TTL timestamp)
         metrics = {}
         for k, v in it.items():
-            if k in ("RunID", "AlgorithmTaskCount", "Algorithm", "TaskCount"):
+            if k in ("RunID", "AlgorithmTaskCount", "Algorithm", "TaskCount", TTL_ATTRIBUTE):
                 continue
             # Only numeric metrics
             if isinstance(v, (int, float, Decimal)):
@@ -104,8 +147,8 @@ def main():
     args = parser.parse_args()
 
     # Init session
-    session = boto3.Session(profile_name=args.aws_profile) if args.aws_profile else boto3.Session()
-    ddb = session.resource("dynamodb")
+    session = get_session(args.aws_profile)
+    ddb = session.resource("dynamodb", config=BOTO_CONFIG)
     table = ddb.Table(args.dynamo_table)
 
     print(f"Fetching results from DynamoDB table '{args.dynamo_table}' for RunID '{args.run_id}' ...")
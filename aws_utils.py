@@ -1,11 +1,52 @@
 import boto3
+from boto3.dynamodb.types import TypeSerializer
+import numpy as np
 import os
+import time
+import zlib
 from decimal import Decimal
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+# Shared client configuration: a larger HTTP connection pool (reused across
+# concurrent calls), TCP keep-alive, and adaptive retries for throttling.
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+)
+
+# Parallel scan segments (and delete threads) used when clearing a table
+SCAN_SEGMENTS = 8
+
+# Writer threads used when logging metrics
+WRITE_WORKERS = 8
+
+# BatchWriteItem limit, and how many times UnprocessedItems are re-sent
+# (with exponential backoff) before giving up
+BATCH_WRITE_SIZE = 25
+BATCH_WRITE_RETRIES = 10
+
+# Items expire this many days after they are logged (DynamoDB TTL on the
+# ExpiresAt epoch-seconds attribute), so the table does not grow unbounded
+RESULTS_TTL_DAYS = 7
+TTL_ATTRIBUTE = 'ExpiresAt'
+
+# VmFinishTimes are stored as a zlib-compressed little-endian float64 blob,
+# tagged with this encoding (items without the tag hold a list of numbers)
+VM_TIMES_ENCODING = 'zlib+f64le'
 
 # Global clients, initialized by main
 dynamodb_client = None
 dynamodb_resource = None
+# The client's ResourceNotFoundException class, resolved once by init_clients
+RESOURCE_NOT_FOUND = None
+
+@functools.lru_cache(maxsize=None)
+def get_session(profile_name=None, region_name=None):
+    """Shared boto3 Session per (profile, region), so credentials and config are resolved once per process."""
+    return boto3.Session(profile_name=profile_name, region_name=region_name)
 
 def init_clients(profile_name=None, region_name=None):
     """Initialize Boto3 clients with an optional profile and region.
@@ -16,14 +57,14 @@ def init_clients(profile_name=None, region_name=None):
     3) Region configured in the provided profile (if any)
     If none found, raise a clear error rather than relying on implicit defaults.
     """
-    global dynamodb_client, dynamodb_resource
+    global dynamodb_client, dynamodb_resource, RESOURCE_NOT_FOUND
 
     # Resolve region
     region = region_name or os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
 
     # If a profile is provided and region still unknown, try reading from that profile
     if profile_name and not region:
-        _probe = boto3.Session(profile_name=profile_name)
+        _probe = get_session(profile_name)
         region = _probe.region_name
 
     if not region:
@@ -32,9 +73,11 @@ def init_clients(profile_name=None, region_name=None):
             "or configure a default region in your AWS profile."
         )
 
-    session = boto3.Session(profile_name=profile_name, region_name=region)
-    dynamodb_client = session.client('dynamodb')
-    dynamodb_resource = session.resource('dynamodb')
+    session = get_session(profile_name, region)
+    _describe_table.cache_clear()
+    dynamodb_client = session.client('dynamodb', config=BOTO_CONFIG)
+    dynamodb_resource = session.resource('dynamodb', config=BOTO_CONFIG)
+    RESOURCE_NOT_FOUND = dynamodb_client.exceptions.ResourceNotFoundException
 
 def ensure_dynamodb_table(table_name):
     """Ensure the DynamoDB table exists with the expected schema; create if missing."""
@@ -42,9 +85,9 @@ def ensure_dynamodb_table(table_name):
         raise Exception("AWS clients not initialized. Call init_clients() first.")
 
     try:
-        dynamodb_client.describe_table(TableName=table_name)
+        _describe_table(table_name)
         return
-    except dynamodb_client.exceptions.ResourceNotFoundException:
+    except RESOURCE_NOT_FOUND:
         pass
     except Exception:
         # Fall through to create just in case of unexpected errors
@@ -65,54 +108,207 @@ def ensure_dynamodb_table(table_name):
     )
     # Wait for table creation
     table.meta.client.get_waiter('table_exists').wait(TableName=table_name)
+    _enable_ttl(table_name)
     return
 
-def clear_dynamodb_table(table_name):
+def _enable_ttl(table_name):
+    """Turns on TTL expiry of items on the TTL_ATTRIBUTE timestamp."""
+    dynamodb_client.update_time_to_live(
+        TableName=table_name,
+        TimeToLiveSpecification={'Enabled': True, 'AttributeName': TTL_ATTRIBUTE},
+    )
+
+@functools.lru_cache(maxsize=32)
+def _describe_table(table_name):
+    """
+    DescribeTable result for a table, fetched once per process and shared by
+    ensure/clear (cleared by init_clients). Only the key schema and index
+    layout are read from it, and those do not change while we run.
+    """
+    return dynamodb_client.describe_table(TableName=table_name)['Table']
+
+def _key_schema(table_name):
+    """Key attribute names of a table (partition key first)."""
+    return [k['AttributeName'] for k in _describe_table(table_name)['KeySchema']]
+
+# One serializer for every item written through _batch_write
+_serializer = TypeSerializer()
+
+def _put_request(item):
+    """BatchWriteItem put request for a plain Python item."""
+    return {'PutRequest': {'Item': {k: _serializer.serialize(v) for k, v in item.items()}}}
+
+def _batch_write(table_name, requests):
+    """
+    Sends low-level write requests (PutRequest/DeleteRequest) in
+    BatchWriteItem calls of at most BATCH_WRITE_SIZE, re-sending any
+    UnprocessedItems with exponential backoff. Safe to call from several
+    threads at once (it only uses the shared client).
+    """
+    for i in range(0, len(requests), BATCH_WRITE_SIZE):
+        pending = requests[i:i+BATCH_WRITE_SIZE]
+        for attempt in range(BATCH_WRITE_RETRIES + 1):
+            response = dynamodb_client.batch_write_item(RequestItems={table_name: pending})
+            pending = response.get('UnprocessedItems', {}).get(table_name)
+            if not pending:
+                break
+            if attempt < BATCH_WRITE_RETRIES:
+                time.sleep(min(0.05 * 2 ** attempt, 30))
+        else:
+            raise Exception(f"{len(pending)} items to {table_name} were still unprocessed after {BATCH_WRITE_RETRIES} retries.")
+
+def _delete_pages(table_name, pages):
+    """Deletes the (key-only, low-level) items of each scan/query page as it arrives."""
+    deleted = 0
+    for page in pages:
+        items = page.get('Items', [])
+        _batch_write(table_name, [{'DeleteRequest': {'Key': key}} for key in items])
+        deleted += len(items)
+    return deleted
+
+def _clear_segment(table_name, segment, total_segments, projection):
+    """
+    Deletes the items of one parallel scan segment, page by page.
+    Returns the number of items deleted.
+    """
+    paginator = dynamodb_client.get_paginator('scan')
+    pages = paginator.paginate(
+        TableName=table_name,
+        ProjectionExpression=projection,
+        Segment=segment,
+        TotalSegments=total_segments,
+    )
+    return _delete_pages(table_name, pages)
+
+def _recreate_dynamodb_table(table_name):
+    """
+    Empties a table by deleting and re-creating it with the same key schema and
+    billing mode: O(1) API calls and no write capacity used, regardless of size.
+    Returns False (leaving the table untouched) if it has secondary indexes or
+    a stream, which would not be preserved.
+    """
+    desc = _describe_table(table_name)
+    if (desc.get('GlobalSecondaryIndexes') or desc.get('LocalSecondaryIndexes')
+            or desc.get('StreamSpecification', {}).get('StreamEnabled')):
+        return False
+
+    create_kwargs = {
+        'TableName': table_name,
+        'KeySchema': desc['KeySchema'],
+        'AttributeDefinitions': desc['AttributeDefinitions'],
+    }
+    billing_mode = desc.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
+    if billing_mode == 'PAY_PER_REQUEST':
+        create_kwargs['BillingMode'] = 'PAY_PER_REQUEST'
+    else:
+        throughput = desc['ProvisionedThroughput']
+        create_kwargs['ProvisionedThroughput'] = {
+            'ReadCapacityUnits': throughput['ReadCapacityUnits'],
+            'WriteCapacityUnits': throughput['WriteCapacityUnits'],
+        }
+
+    dynamodb_client.delete_table(TableName=table_name)
+    dynamodb_client.get_waiter('table_not_exists').wait(TableName=table_name)
+    dynamodb_client.create_table(**create_kwargs)
+    dynamodb_client.get_waiter('table_exists').wait(TableName=table_name)
+    # TTL is a table setting, so it does not survive the delete
+    _enable_ttl(table_name)
+    return True
+
+def clear_dynamodb_table(table_name, mode='scan'):
     """
-    Scans and deletes all items from a DynamoDB table.
+    Deletes all items from a DynamoDB table.
     This fulfills the "delete previous logs" requirement.
+
+    mode='scan'  scans the keys and batch-deletes them (cheap for small tables)
+    mode='reset' drops and re-creates the table (constant cost for large tables);
+                 falls back to 'scan' if the table has indexes or a stream
     """
     if not dynamodb_resource or not dynamodb_client:
         raise Exception("AWS clients not initialized. Call init_clients() first.")
 
-    table = dynamodb_resource.Table(table_name)
-    
-    # Get the primary key schema
-    try:
-        table_desc = dynamodb_client.describe_table(TableName=table_name)
-        key_schema = table_desc['Table']['KeySchema']
-        keys_to_project = [k['AttributeName'] for k in key_schema]
-    except Exception as e:
-        print(f"Could not describe table {table_name}. Assuming standard keys (RunID, AlgorithmTaskCount)...")
-        keys_to_project = ['RunID', 'AlgorithmTaskCount']
-
-    # Scan for items (projection expression to get only keys)
-    scan_kwargs = {
-        'ProjectionExpression': ", ".join(keys_to_project)
-    }
-    
-    items_to_delete = []
-    response = table.scan(**scan_kwargs)
-    items_to_delete.extend(response.get('Items', []))
-    
-    while 'LastEvaluatedKey' in response:
-        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-        response = table.scan(**scan_kwargs)
-        items_to_delete.extend(response.get('Items', []))
+    if mode == 'reset':
+        if _recreate_dynamodb_table(table_name):
+            print(f"Re-created {table_name} (all items removed).")
+            return
+        print(f"{table_name} has secondary indexes or a stream; clearing by scan instead.")
+
+    # Get the primary key schema (cached per table)
+    keys_to_project = _key_schema(table_name)
 
-    if not items_to_delete:
+    # Scan for keys (projection expression) in parallel segments, one worker
+    # thread per segment; each worker deletes its pages as they arrive
+    # (25-item BatchWriteItem calls), so the keys are never collected in memory
+    projection = ", ".join(keys_to_project)
+    with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as pool:
+        deleted = sum(pool.map(
+            lambda seg: _clear_segment(table_name, seg, SCAN_SEGMENTS, projection),
+            range(SCAN_SEGMENTS),
+        ))
+
+    if not deleted:
         print("Table is already empty.")
         return
 
-    # Batch delete items
-    with table.batch_writer() as batch:
-        for item in items_to_delete:
-            batch.delete_item(Key=item)
-            
-    print(f"Deleted {len(items_to_delete)} items from {table_name}.")
+    print(f"Deleted {deleted} items from {table_name}.")
+
+
+def clear_run(table_name, run_id):
+    """
+    Deletes only the items of one run. Every item of a run shares its RunID
+    partition key, so a Query on that key finds them without scanning the
+    rest of the table. Returns the number of items deleted.
+    """
+    if not dynamodb_resource or not dynamodb_client:
+        raise Exception("AWS clients not initialized. Call init_clients() first.")
+
+    keys_to_project = _key_schema(table_name)
+
+    paginator = dynamodb_client.get_paginator('query')
+    pages = paginator.paginate(
+        TableName=table_name,
+        KeyConditionExpression="#pk = :run_id",
+        ExpressionAttributeNames={"#pk": keys_to_project[0]},
+        ExpressionAttributeValues={":run_id": {"S": run_id}},
+        ProjectionExpression=", ".join(keys_to_project),
+    )
+    return _delete_pages(table_name, pages)
+
+
+def _to_decimal(o):
+    """Convert floats (and nested dicts/lists/tuples) to DynamoDB-compatible Decimals in one pass."""
+    if isinstance(o, float):
+        return Decimal(str(o))
+    if isinstance(o, dict):
+        return {k: _to_decimal(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_to_decimal(v) for v in o]
+    return o
+
+
+def _number_values(values):
+    """
+    Convert a flat sequence of numbers (floats, NumPy scalars or an array) to
+    DynamoDB number attribute values. NumPy unboxes everything to Python
+    floats in one pass, and repr() of a float is its shortest round-trip string.
+    """
+    return [{'N': repr(f)} for f in np.asarray(list(values), dtype=np.float64).tolist()]
+
+
+def encode_vm_times(values):
+    """Pack per-VM finish times into compressed float64 bytes (see VM_TIMES_ENCODING)."""
+    return zlib.compress(np.asarray(values, dtype='<f8').tobytes(), 6)
 
 
-def log_results_to_dynamodb(table_name, run_id, experiment_results, sim_params, final_times=None, assignment_logs=None):
+def decode_vm_times(item):
+    """Per-VM finish times of a FinalTimes item as floats, in either storage format."""
+    values = item['VmFinishTimes']
+    if item.get('VmFinishTimesEncoding') == VM_TIMES_ENCODING:
+        return np.frombuffer(zlib.decompress(bytes(values)), dtype='<f8').tolist()
+    return np.fromiter((float(x) for x in values), dtype=np.float64, count=len(values)).tolist()
+
+
+def log_results_to_dynamodb(table_name, run_id, experiment_results, sim_params, final_times=None, assignment_logs=None, ttl_days=RESULTS_TTL_DAYS):
     """
     Logs the experiment results to the specified DynamoDB table.
     
@@ -120,79 +316,95 @@ def log_results_to_dynamodb(table_name, run_id, experiment_results, sim_params,
     - PrimaryKey: RunID (str)
     - SortKey: AlgorithmTaskCount (str, e.g., "ACO-400")
     - Other attributes: Algorithm (str), TaskCount (int), and all metrics.
+    - ExpiresAt (epoch seconds): TTL expiry, ttl_days after logging
+      (ttl_days=None keeps the items until they are cleared).
     """
     if not dynamodb_resource:
         raise Exception("AWS clients not initialized. Call init_clients() first.")
 
-    table = dynamodb_resource.Table(table_name)
-    
-    with table.batch_writer() as batch:
-        # Log simulation parameters as a special item
-        params_key = f"params"
-        params_item = {
-            'RunID': run_id,
-            'AlgorithmTaskCount': params_key,
-            'Algorithm': 'SimulationParameters',
-            'Params': json.loads(json.dumps(sim_params), parse_float=Decimal) # Store params
-        }
-        batch.put_item(Item=params_item)
-
-        # Log experiment results (per task_count and algorithm)
-        for task_count, algos in experiment_results.items():
-            for algo_name, metrics in algos.items():
-                
-                # Create the composite sort key
-                item_key = f"{algo_name}-{task_count}"
-                
-                # Convert floats to Decimals for DynamoDB
-                metrics_decimal = {k: Decimal(str(v)) for k, v in metrics.items()}
-                
-                item = {
-                    'RunID': run_id,
-                    'AlgorithmTaskCount': item_key,
-                    'Algorithm': algo_name,
-                    'TaskCount': task_count,
-                    **metrics_decimal
-                }
-                
-                batch.put_item(Item=item)
-
-        # Optionally store final per-VM finish times for bar charts (max tasks)
-        if final_times:
+    expiry = {TTL_ATTRIBUTE: {'N': str(int(time.time()) + int(ttl_days * 86400))}} if ttl_days else {}
+
+    # Experiment result items (per task_count and algorithm) have a fixed
+    # shape, so they are built directly in low-level attribute-value form
+    # with the composite sort key; only the free-form extras below go
+    # through the serializer
+    requests = [
+        {'PutRequest': {'Item': {
+            'RunID': {'S': run_id},
+            'AlgorithmTaskCount': {'S': f"{algo_name}-{task_count}"},
+            'Algorithm': {'S': algo_name},
+            'TaskCount': {'N': str(task_count)},
+            **dict(zip(metrics.keys(), _number_values(metrics.values()))),
+            **expiry,
+        }}}
+        for task_count, algos in experiment_results.items()
+        for algo_name, metrics in algos.items()
+    ]
+    for item in _run_extra_items(run_id, sim_params, final_times, assignment_logs):
+        request = _put_request(item)
+        request['PutRequest']['Item'].update(expiry)
+        requests.append(request)
+
+    # All items of the run (metrics plus the params/FinalTimes/AssignmentLog
+    # extras) are packed into full 25-item shards, one BatchWriteItem each,
+    # written on worker threads. 25 items of at most 400KB stay well below
+    # the 16MB request limit, so item count is the only bound needed.
+    shards = [requests[i:i+BATCH_WRITE_SIZE] for i in range(0, len(requests), BATCH_WRITE_SIZE)]
+    with ThreadPoolExecutor(max_workers=max(1, min(WRITE_WORKERS, len(shards)))) as pool:
+        list(pool.map(lambda shard: _batch_write(table_name, shard), shards))
+
+
+def _run_extra_items(run_id, sim_params, final_times, assignment_logs):
+    """Yields the params, FinalTimes-* and AssignmentLog-* items of a run."""
+    # Log simulation parameters as a special item
+    params_key = f"params"
+    params_item = {
+        'RunID': run_id,
+        'AlgorithmTaskCount': params_key,
+        'Algorithm': 'SimulationParameters',
+        'Params': _to_decimal(sim_params) # Store params
+    }
+    yield params_item
+
+    # Optionally store final per-VM finish times for bar charts (max tasks)
+    if final_times:
+        max_tasks = None
+        try:
+            # Use configured max task step when present
+            max_tasks = sim_params.get('TASK_STEPS', [])[-1]
+        except Exception:
             max_tasks = None
+
+        for algo_name, times in final_times.items():
+            # Store as one compressed binary attribute rather than a list
+            # of numbers (far smaller items, so fewer write units)
             try:
-                # Use configured max task step when present
-                max_tasks = sim_params.get('TASK_STEPS', [])[-1]
+                num_vms = len(times)
+                vm_finish_times = encode_vm_times(times)
             except Exception:
-                max_tasks = None
-
-            for algo_name, times in final_times.items():
-                # Convert numpy arrays to list and floats to Decimals
-                try:
-                    as_list = [float(x) for x in list(times)]
-                except Exception:
-                    continue
-                item = {
-                    'RunID': run_id,
-                    'AlgorithmTaskCount': f"FinalTimes-{algo_name}",
-                    'Algorithm': algo_name,
-                    'TaskCount': max_tasks if max_tasks is not None else 0,
-                    'NumVMs': len(as_list),
-                    'VmFinishTimes': [Decimal(str(v)) for v in as_list],
-                }
-                batch.put_item(Item=item)
-
-        # Optionally store assignment logs (first 50 entries per algorithm)
-        if assignment_logs:
-            for algo_name, logs in assignment_logs.items():
-                if not logs:
-                    continue
-                item = {
-                    'RunID': run_id,
-                    'AlgorithmTaskCount': f"AssignmentLog-{algo_name}",
-                    'Algorithm': algo_name,
-                    'Logs': logs[:50],
-                }
-                batch.put_item(Item=item)
-                
+                continue
+            item = {
+                'RunID': run_id,
+                'AlgorithmTaskCount': f"FinalTimes-{algo_name}",
+                'Algorithm': algo_name,
+                'TaskCount': max_tasks if max_tasks is not None else 0,
+                'NumVMs': num_vms,
+                'VmFinishTimes': vm_finish_times,
+                'VmFinishTimesEncoding': VM_TIMES_ENCODING,
+            }
+            yield item
+
+    # Optionally store assignment logs (first 50 entries per algorithm)
+    if assignment_logs:
+        for algo_name, logs in assignment_logs.items():
+            if not logs:
+                continue
+            item = {
+                'RunID': run_id,
+                'AlgorithmTaskCount': f"AssignmentLog-{algo_name}",
+                'Algorithm': algo_name,
+                'Logs': logs[:50],
+            }
+            yield item
+            
 # S3 upload functionality removed; DynamoDB logging remains for metrics and final VM times.
\ No newline at end of file
@@ -1,3 +1,5 @@
+import json
+
 # --- Default Simulation Parameters ---
 DEFAULT_NUM_VMS = 20
 DEFAULT_VM_MIPS_RANGE = (100, 1000)
@@ -15,4 +17,34 @@ def get_default_params():
         "TASK_STEPS": DEFAULT_TASK_STEPS,
         "RHO_WEIGHTS": DEFAULT_RHO_WEIGHTS,
         "ACO_PARAMS": DEFAULT_ACO_PARAMS
-    }
\ No newline at end of file
+    }
+
+def load_params_file(path):
+    """
+    Returns the default parameters updated from a JSON file, e.g.
+    {"NUM_VMS": 40, "TASK_STEPS": [500, 1000], "ACO_PARAMS": [1.0, 2.0, 0.1]}.
+    Keys left out keep their defaults; values are coerced to the default types.
+    """
+    with open(path) as f:
+        overrides = json.load(f)
+
+    params = get_default_params()
+    unknown = set(overrides) - set(params)
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) in {path}: {', '.join(sorted(unknown))}")
+
+    if "NUM_VMS" in overrides:
+        params["NUM_VMS"] = int(overrides["NUM_VMS"])
+    for key in ("VM_MIPS_RANGE", "TASK_LENGTH_RANGE"):
+        if key in overrides:
+            params[key] = tuple(int(x) for x in overrides[key])
+    if "TASK_STEPS" in overrides:
+        params["TASK_STEPS"] = [int(x) for x in overrides["TASK_STEPS"]]
+    if "RHO_WEIGHTS" in overrides:
+        params["RHO_WEIGHTS"] = tuple(float(x) for x in overrides["RHO_WEIGHTS"])
+    if "ACO_PARAMS" in overrides:
+        aco = [float(x) for x in overrides["ACO_PARAMS"]]
+        if len(aco) == 3:
+            aco.append(0.0)
+        params["ACO_PARAMS"] = tuple(aco)
+    return params
@@ -1,3 +1,12 @@
+import numpy as np
+
+# Record layout of a task batch (see create_tasks): one contiguous array
+# whose records index like create_task dicts (task['id'], task['length'])
+TASK_DTYPE = np.dtype([('id', np.int64), ('length', np.float64)])
+
+# Record layout of a VM fleet (see create_vms), indexed like create_vm dicts
+VM_DTYPE = np.dtype([('id', np.int64), ('mips', np.float64), ('p_max', np.float64), ('p_idle', np.float64)])
+
 def create_vm(vm_id, mips):
     """Creates a VM dict with a power model based on MIPS."""
     # Simple model: power scales with MIPS.
@@ -11,9 +20,28 @@ def create_vm(vm_id, mips):
         "p_idle": p_idle
     }
 
+def create_vms(mips_values):
+    """
+    Creates VMs 0..n-1 for a sequence of MIPS ratings as a VM_DTYPE structured
+    array, with the same power model as create_vm evaluated over all VMs at once.
+    """
+    vms = np.empty(len(mips_values), dtype=VM_DTYPE)
+    vms['id'] = np.arange(len(mips_values))
+    vms['mips'] = mips_values
+    vms['p_max'] = (vms['mips'] * 0.2) + 150
+    vms['p_idle'] = vms['p_max'] * 0.7
+    return vms
+
 def create_task(task_id, length):
     """A Task is defined by its ID and its length in MI (Million Instructions)"""
     return {
         "id": task_id,
         "length": length
-    }
\ No newline at end of file
+    }
+
+def create_tasks(lengths):
+    """Creates tasks 0..n-1 with the given lengths (MI) as a TASK_DTYPE structured array."""
+    tasks = np.empty(len(lengths), dtype=TASK_DTYPE)
+    tasks['id'] = np.arange(len(lengths))
+    tasks['length'] = lengths
+    return tasks
@@ -5,17 +5,18 @@ from datetime import datetime
 
 import config
 import interactive
-import simulation
-import aws_utils
-import metrics
-import plotting
-import aws_cloudwatch
 
-def run_simulation(sim_params):
+def run_simulation(sim_params, parallel=False):
     """Runs the simulation and returns the results."""
+    # NumPy/matplotlib are only imported once a run actually starts,
+    # so --help and argument errors return immediately
+    import simulation
+    import metrics
+    import plotting
+
     start_time = time.time()
     
-    experiment_results, final_metrics, final_times, balancers = simulation.run_experiment(sim_params)
+    experiment_results, final_metrics, final_times, balancers = simulation.run_experiment(sim_params, parallel=parallel)
     
     end_time = time.time()
     print(f"\n--- EXPERIMENT COMPLETE ({end_time - start_time:.2f} seconds) ---")
@@ -47,16 +48,22 @@ def handle_aws_operations(args, run_id, sim_params, experiment_results, plot_fil
     if not args.aws_enabled:
         return
 
+    # AWS modules (and boto3) are only imported for AWS-enabled runs
+    import aws_utils
+    import aws_cloudwatch
+
     print("\n--- Logging results to AWS ---")
     try:
         # Ensure the DynamoDB table exists
         print(f"Ensuring DynamoDB table exists: {args.dynamo_table}...")
         aws_utils.ensure_dynamodb_table(args.dynamo_table)
 
-        # Clear previous results from DynamoDB
-        print(f"Clearing previous results from DynamoDB table: {args.dynamo_table}...")
-        aws_utils.clear_dynamodb_table(args.dynamo_table)
-        print("DynamoDB table cleared.")
+        # Clear previous results from DynamoDB (opt-in: each run writes under
+        # its own unique RunID, so earlier runs never collide with this one)
+        if args.wipe_history:
+            print(f"Clearing previous results from DynamoDB table: {args.dynamo_table}...")
+            aws_utils.clear_dynamodb_table(args.dynamo_table, mode=args.dynamo_clear_mode)
+            print("DynamoDB table cleared.")
 
         # Log experiment data to DynamoDB
         print("Logging experiment data to DynamoDB...")
@@ -73,8 +80,6 @@ def handle_aws_operations(args, run_id, sim_params, experiment_results, plot_fil
         )
         print("DynamoDB logging complete.")
 
-        # Note: S3 uploads removed. Graphs are stored locally; DynamoDB holds metrics and final VM times.
-
         # Publish CloudWatch metrics and create a comparison dashboard
         if final_metrics:
             print("Publishing CloudWatch metrics and dashboard...")
@@ -108,7 +113,7 @@ def main():
     parser.add_argument(
         '--aws-enabled', 
         action='store_true', 
-        help="Enable logging results to AWS (DynamoDB and S3)"
+        help="Enable logging results to AWS (DynamoDB and CloudWatch)"
     )
     parser.add_argument(
         '--aws-profile', 
@@ -126,11 +131,19 @@ def main():
         help="Name of the DynamoDB table to use"
     )
     parser.add_argument(
-        '--s3-bucket',
-        default=None,
-        help=argparse.SUPPRESS  # Deprecated; S3 uploads removed
+        '--wipe-history',
+        action='store_true',
+        help="Delete all previous results from the DynamoDB table before logging this run"
+    )
+    parser.add_argument(
+        '--dynamo-clear-mode',
+        choices=['scan', 'reset'],
+        default='scan',
+        help="How --wipe-history clears previous results: 'scan' batch-deletes items, 'reset' drops and re-creates the table (faster for large tables)"
     )
     # Note: interactive prompts are now the default; CLI overrides still supported.
+    parser.add_argument('--skip-interactive', action='store_true', help='Use the default parameters without prompting')
+    parser.add_argument('--params-file', type=str, default=None, help='JSON file of parameters to use instead of prompting (missing keys keep their defaults)')
     # Simulation parameter overrides via CLI
     parser.add_argument('--num-vms', type=int, default=None, help='Number of VMs')
     parser.add_argument('--vm-mips-range', type=str, default=None, help='VM MIPS range as min,max')
@@ -139,6 +152,8 @@ def main():
     parser.add_argument('--rho-weights', type=str, default=None, help='RHO weights as w1,w2')
     parser.add_argument('--aco-params', type=str, default=None, help='ACO params as alpha,beta,evap[,q0]')
     parser.add_argument('--random-seed', type=int, default=None, help='Random seed for reproducible runs')
+    parser.add_argument('--parallel', action='store_true', help='Run the algorithms in parallel worker processes (same results)')
+    parser.add_argument('--profile', nargs='?', const='run.prof', default=None, metavar='PATH', help='Profile the simulation with cProfile, print the hottest functions and save the stats to PATH (default: run.prof)')
     
     args = parser.parse_args()
     
@@ -152,6 +167,7 @@ def main():
         print("--------------------------")
         
         # Initialize AWS clients
+        import aws_utils
         aws_utils.init_clients(args.aws_profile, args.aws_region)
 
     # --- Get Simulation Parameters ---
@@ -165,8 +181,14 @@ def main():
     def parse_floats(s):
         return [float(x.strip()) for x in s.split(',') if x.strip()]
 
-    # Always prompt for parameters, then apply any CLI overrides on top
-    sim_params = interactive.get_simulation_parameters()
+    # Prompt for parameters unless they come from a file (or defaults are
+    # requested), then apply any CLI overrides on top
+    if args.params_file:
+        sim_params = config.load_params_file(args.params_file)
+    elif args.skip_interactive:
+        sim_params = config.get_default_params()
+    else:
+        sim_params = interactive.get_simulation_parameters()
 
     # Apply CLI overrides if provided (takes precedence over interactive answers)
     if args.num_vms is not None:
@@ -205,7 +227,19 @@ def main():
         _np.random.seed(args.random_seed)
         print(f"Random seed set to {args.random_seed}")
 
-    experiment_results, plot_files, final_metrics, final_times, balancers = run_simulation(sim_params)
+    if args.profile:
+        # Profile the run to see which functions are actually hot before optimizing
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        experiment_results, plot_files, final_metrics, final_times, balancers = profiler.runcall(
+            run_simulation, sim_params, parallel=args.parallel
+        )
+        profiler.dump_stats(args.profile)
+        print(f"\n--- PROFILE (top 30 by cumulative time, saved to {args.profile}) ---")
+        pstats.Stats(profiler).strip_dirs().sort_stats('cumulative').print_stats(30)
+    else:
+        experiment_results, plot_files, final_metrics, final_times, balancers = run_simulation(sim_params, parallel=args.parallel)
 
     # --- Handle AWS Operations ---
     handle_aws_operations(args, run_id, sim_params, experiment_results, plot_files, final_metrics, final_times, balancers)
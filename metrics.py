@@ -5,33 +5,29 @@ def calculate_metrics(balancer, vm_finish_times, num_tasks):
     Calculates and returns key performance metrics from the simulation results.
     """
     
+    # Per-VM busy time (finish time) as an array; reductions below use the
+    # ndarray methods directly
+    busy_time = np.asarray(vm_finish_times, dtype=np.float64)
+
     # 1. Makespan (Eq. 1)
-    makespan = np.max(vm_finish_times)
+    makespan = busy_time.max()
     
     # 2. Average Response Time (Eq. 2)
-    # (Sum of all task response times) / (Num tasks)
-    all_rts = [log['response_time'] for log in balancer.task_log]
-    avg_response_time = np.mean(all_rts) if all_rts else 0
+    # (Sum of all task response times) / (Num tasks), over the balancer's
+    # response-time buffer
+    all_rts = balancer.task_response_times
+    avg_response_time = all_rts.mean() if len(all_rts) else 0
     
     # 3. Throughput
     # (Num tasks) / (Total time)
     throughput = num_tasks / makespan if makespan > 0 else 0
     
-    # 4. Total Energy Consumption (Eq. 3 & 4)
-    total_energy = 0
-    for i in range(balancer.num_vms):
-        vm = balancer.vms[i]
-        busy_time = vm_finish_times[i]
-        
-        # Idle time is the duration from when the VM finishes its
-        # work until the entire simulation (makespan) ends.
-        idle_time = makespan - busy_time
-        if idle_time < 0: idle_time = 0 # Handle potential float precision
-        
-        energy_busy = vm["p_max"] * busy_time
-        energy_idle = vm["p_idle"] * idle_time
-        
-        total_energy += (energy_busy + energy_idle)
+    # 4. Total Energy Consumption (Eq. 3 & 4), over the balancer's per-VM
+    # power arrays. Idle time is the duration from when the VM finishes its
+    # work until the entire simulation (makespan) ends (clipped at 0 to
+    # handle potential float precision).
+    idle_time = np.maximum(makespan - busy_time, 0)
+    total_energy = float(balancer.p_max @ busy_time + balancer.p_idle @ idle_time)
         
     return {
         "Makespan_s": makespan,
@@ -65,27 +61,21 @@ def print_comparison(metrics_dict):
           f"{headers[5]:<25}")
     print("-" * 130)
 
-    for key in baseline_metrics.keys():
-        rr_val = baseline_metrics[key]
-        rho_val = metrics_dict["RHO"][key]
-        aco_val = metrics_dict["ACO"][key]
-        
-        row = [f"{key:<22}", f"{rr_val:<15.2f}", f"{rho_val:<15.2f}", f"{aco_val:<15.2f}"]
+    # (metrics, [RR, RHO, ACO]) matrix; improvements vs Round Robin are
+    # computed for the whole table at once (sign flipped where higher is
+    # better, 0 where the baseline is not positive)
+    keys = list(baseline_metrics.keys())
+    table = np.array([[metrics_dict[a][key] for a in (baseline_key, "RHO", "ACO")] for key in keys], dtype=np.float64)
+    base = table[:, :1]
+    higher_is_better = np.array(["Throughput" in key for key in keys])[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        improvements = np.where(higher_is_better, table[:, 1:] - base, base - table[:, 1:]) / base * 100
+    improvements = np.where(base > 0, improvements, 0.0)
 
-        # Calculate improvements vs Round Robin
-        def calc_imp(val, base):
-            if "Throughput" not in key: # Lower is better
-                return ((base - val) / base) * 100 if base > 0 else 0
-            else: # Higher is better
-                return ((val - base) / base) * 100 if base > 0 else 0
-        
-        imp_rho = calc_imp(rho_val, rr_val)
-        imp_aco = calc_imp(aco_val, rr_val)
-        
-        row.append(f"{imp_rho:>25.2f}%")
-        row.append(f"{imp_aco:>25.2f}%")
-        
-        print(" | ".join(row))
+    print("\n".join(
+        f"{key:<22} | {rr_val:<15.2f} | {rho_val:<15.2f} | {aco_val:<15.2f} | {imp_rho:>25.2f}% | {imp_aco:>25.2f}%"
+        for key, (rr_val, rho_val, aco_val), (imp_rho, imp_aco) in zip(keys, table.tolist(), improvements.tolist())
+    ))
         
     print("=" * 130)
     print("* Improvement shows performance vs. Round Robin.")
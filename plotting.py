@@ -1,5 +1,16 @@
-import matplotlib.pyplot as plt
+import functools
+
 import numpy as np
+from matplotlib.figure import Figure
+
+@functools.lru_cache(maxsize=None)
+def _figure(figsize):
+    """
+    Reusable Figure per size, cleared before each plot. Built with the
+    object-oriented API (not pyplot), so no figure manager or GUI backend
+    is involved and the same figure is drawn into across runs.
+    """
+    return Figure(figsize=figsize)
 
 def plot_single_run_results(finish_times_dict, metrics_dict, num_vms):
     """
@@ -11,7 +22,9 @@ def plot_single_run_results(finish_times_dict, metrics_dict, num_vms):
     num_algos = len(algorithms)
     
     # --- Plot 1: Load Distribution (Finish Time per VM) ---
-    plt.figure(figsize=(18, 7))
+    fig = _figure((18, 7))
+    fig.clear()
+    ax = fig.add_subplot()
     
     x = np.arange(num_vms)
     width = 0.8 / num_algos # Make bars thinner to fit
@@ -20,22 +33,24 @@ def plot_single_run_results(finish_times_dict, metrics_dict, num_vms):
     
     for i, (algo, times) in enumerate(finish_times_dict.items()):
         offset = (i - (num_algos - 1) / 2) * width
-        plt.bar(x + offset, times, width, label=algo, color=colors[i % len(colors)])
+        ax.bar(x + offset, times, width, label=algo, color=colors[i % len(colors)])
     
-    plt.ylabel('VM Finish Time (seconds)')
-    plt.title('Load Distribution Comparison (for Max Tasks)')
-    plt.xticks(x, vm_ids, rotation=45)
-    plt.legend()
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
+    ax.set_ylabel('VM Finish Time (seconds)')
+    ax.set_title('Load Distribution Comparison (for Max Tasks)')
+    ax.set_xticks(x, vm_ids, rotation=45)
+    ax.legend()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
     
     graph_file_1 = 'load_distribution.png'
-    plt.savefig(graph_file_1)
+    fig.savefig(graph_file_1)
     
     # --- Plot 2: Metrics Comparison ---
     metrics_to_plot = list(metrics_dict[algorithms[0]].keys())
     
-    plt.figure(figsize=(15, 7))
+    fig = _figure((15, 7))
+    fig.clear()
+    ax = fig.add_subplot()
     
     x = np.arange(len(metrics_to_plot))
     width = 0.8 / num_algos
@@ -43,19 +58,18 @@ def plot_single_run_results(finish_times_dict, metrics_dict, num_vms):
     for i, algo in enumerate(algorithms):
         values = [metrics_dict[algo][key] for key in metrics_to_plot]
         offset = (i - (num_algos - 1) / 2) * width
-        plt.bar(x + offset, values, width, label=algo, color=colors[i % len(colors)])
+        ax.bar(x + offset, values, width, label=algo, color=colors[i % len(colors)])
     
-    plt.ylabel('Value')
-    plt.title('Key Performance Metrics Comparison (for Max Tasks)')
-    plt.xticks(x, [k.replace('_', ' ') for k in metrics_to_plot], rotation=15)
-    plt.legend()
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
+    ax.set_ylabel('Value')
+    ax.set_title('Key Performance Metrics Comparison (for Max Tasks)')
+    ax.set_xticks(x, [k.replace('_', ' ') for k in metrics_to_plot], rotation=15)
+    ax.legend()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
     
     graph_file_2 = 'metrics_comparison.png'
-    plt.savefig(graph_file_2)
+    fig.savefig(graph_file_2)
     
-    plt.close('all')
     return [graph_file_1, graph_file_2]
 
 def plot_experiment_graphs(results_log):
@@ -72,7 +86,9 @@ def plot_experiment_graphs(results_log):
     metrics = list(sample_metrics.keys())
     
     # Create a 2x2 grid for the plots
-    fig, axs = plt.subplots(2, 2, figsize=(15, 12))
+    fig = _figure((15, 12))
+    fig.clear()
+    axs = fig.subplots(2, 2)
     fig.suptitle('Performance Comparison vs. Number of Tasks', fontsize=16)
     
     # Flatten axs for easy iteration
@@ -99,11 +115,10 @@ def plot_experiment_graphs(results_log):
         axs[i].legend()
         axs[i].grid(True, linestyle='--', alpha=0.6)
         
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
     
     graph_file = 'performance_graphs.png'
-    plt.savefig(graph_file)
-    plt.close('all')
+    fig.savefig(graph_file)
     return graph_file
 
 def generate_all_plots(final_times, final_metrics, num_vms, experiment_results):
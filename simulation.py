@@ -1,53 +1,76 @@
+import contextlib
 import random
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import simpy
 
-from entities import create_vm, create_task
+from entities import create_vms, create_tasks
 from algorithms.round_robin import RoundRobinBalancer
 from algorithms.rho import RockHyraxBalancer
 from algorithms.aco import AntColonyBalancer
 import metrics
 
 
-def _simulate_with_simpy(balancer, tasks, vms, log_tasks=False):
+def _seeded_simulate(balancer, tasks, seed):
+    """Worker for simulate_many: seed both RNGs, then run one independent simulation."""
+    random.seed(seed)
+    np.random.seed(seed)
+    return balancer.simulate(tasks)
+
+def simulate_many(balancer, tasks, seeds, max_workers=None):
     """
-    Run a discrete-event simulation for a single balancer using SimPy.
-    Semantics: all tasks arrive at t=0 in the given order; each VM is a single-server queue (FCFS).
-    Balancer decides the VM per task; we then process tasks on that VM at service_time = length/mips.
-    Returns an array of per-VM finish times (i.e., time of last task completion on that VM).
+    Runs one independent simulation of `balancer` over `tasks` per seed, in parallel
+    worker processes. Useful for seed sweeps when comparing algorithms.
+    Returns an (R, N) array of per-VM finish times, row r matching seeds[r]; each row
+    equals what a sequential seeded `balancer.simulate(tasks)` call would return.
     """
-    # Reset balancer internal state for a fresh run
-    balancer.reset()
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        runs = pool.map(_seeded_simulate, [balancer] * len(seeds), [tasks] * len(seeds), seeds)
+        return np.array(list(runs)).reshape(len(seeds), balancer.num_vms)
 
-    env = simpy.Environment()
-
-    # One resource per VM (capacity=1) and a completion tracker
-    vm_resources = [simpy.Resource(env, capacity=1) for _ in vms]
-    vm_last_finish = np.zeros(len(vms), dtype=float)
+def _simulate_sweep(balancer, tasks, task_counts, seed):
+    """
+    Simulate a single balancer over every task step in one pass.
+    Semantics: all tasks arrive at t=0 in the given order; each VM is a single-server queue (FCFS).
+    Balancer decides the VM per task; that VM then processes it at service_time = length/mips.
 
-    def vm_process_task(env, vm_idx, task, resource):
-        # Request the VM (FCFS)
-        with resource.request() as req:
-            yield req
-            # Service time in seconds = MI / MIPS
-            mips = vms[vm_idx]["mips"]
-            service_time = (task['length'] / mips) if mips > 0 else 0
-            yield env.timeout(service_time)
-            vm_last_finish[vm_idx] = env.now
+    Steps are prefixes of the same task list, so the balancer's state after
+    the first k1 tasks is exactly where the next step continues from: the
+    tasks are assigned once, up to the largest step, and results are taken
+    at each (ascending) task count instead of re-simulating every prefix.
+    With every arrival at t=0 a FCFS queue never idles, so a VM's last task
+    completes at its assigned load / MIPS (0 for a zero-MIPS VM), read in
+    closed form from the balancer's loads.
 
-    # Assign tasks and create processes (arrival time = 0)
-    for task in tasks:
-        chosen_vm_id = balancer.assign_task(task, log_tasks)
-        # Start processing immediately; FCFS order preserved by creation order
-        env.process(vm_process_task(env, chosen_vm_id, task, vm_resources[chosen_vm_id]))
+    Returns ([(finish_times, metrics) per task count], balancer) so it can
+    run in a worker process, where the balancer's end state (e.g. its log)
+    lives in the worker's copy.
+    """
+    np.random.seed(seed)
+    # Reset balancer internal state for a fresh run
+    balancer.reset()
 
-    # Run until all tasks finish
-    env.run()
-    return vm_last_finish
+    # One preallocated row of per-VM finish times per step, filled in place
+    step_finish_times = np.empty((len(task_counts), balancer.num_vms))
+    step_results = []
+    assigned = 0
+    for task_count, finish_times in zip(task_counts, step_finish_times):
+        # Assign the next tasks in arrival order; the balancer accumulates per-VM loads
+        # (only the first tasks are logged, so logging stays on for the whole pass)
+        balancer.assign_batch(tasks[assigned:task_count], log_tasks=True)
+        assigned = task_count
+        balancer.get_vm_finish_times(out=finish_times)
+        step_results.append((finish_times, metrics.calculate_metrics(balancer, finish_times, task_count)))
+    return step_results, balancer
 
-def run_experiment(params):
+def run_experiment(params, parallel=False):
     """
     Runs the full simulation experiment over a series of task steps.
+
+    Each balancer runs once over all steps (see _simulate_sweep), seeded from
+    the global NumPy RNG, so with parallel=True the balancers run concurrently
+    in worker processes and still give the same results as a sequential run.
     """
     
     # --- Setup ---
@@ -59,14 +82,17 @@ def run_experiment(params):
     print("=" * 40)
 
     # Create all VMs. They are shared across all balancers.
-    vms = [
-        create_vm(i, random.randint(params['VM_MIPS_RANGE'][0], params['VM_MIPS_RANGE'][1]))
-        for i in range(params['NUM_VMS'])
-    ]
+    # MIPS ratings (and task lengths below) are drawn in one vectorized call
+    # from the global NumPy RNG, inclusive of both range ends
+    vm_mips_min, vm_mips_max = params['VM_MIPS_RANGE']
+    vms = create_vms(np.random.randint(vm_mips_min, vm_mips_max + 1, size=params['NUM_VMS']))
     
+    # Built as one block and written with a single print, not one per VM
     print("--- VM Configuration ---")
-    for vm in vms:
-        print(f"  VM {vm['id']}: {vm['mips']} MIPS, P_max={vm['p_max']:.0f}W, P_idle={vm['p_idle']:.0f}W")
+    print("\n".join(
+        f"  VM {vm['id']}: {vm['mips']:.0f} MIPS, P_max={vm['p_max']:.0f}W, P_idle={vm['p_idle']:.0f}W"
+        for vm in vms
+    ))
     
     # Create all balancers
     rr_balancer = RoundRobinBalancer(vms)
@@ -79,56 +105,45 @@ def run_experiment(params):
         "ACO": aco_balancer
     }
 
-    # Create a master list of tasks
-    max_tasks = params['TASK_STEPS'][-1]
-    all_tasks = [
-        create_task(i, random.randint(params['TASK_LENGTH_RANGE'][0], params['TASK_LENGTH_RANGE'][1]))
-        for i in range(max_tasks)
-    ]
+    # Create a master list of tasks; every step simulates a prefix of it
+    task_counts = sorted(set(params['TASK_STEPS']))
+    max_tasks = task_counts[-1]
+    task_length_min, task_length_max = params['TASK_LENGTH_RANGE']
+    all_tasks = create_tasks(np.random.randint(task_length_min, task_length_max + 1, size=max_tasks))
     
-    experiment_results = {}
+    experiment_results = {task_count: {} for task_count in task_counts}
+    final_times = {}
+    names = list(balancers)
+    # One seed per balancer, drawn up front (each simulation reseeds the
+    # global RNG) so the outcome does not depend on where each simulation runs
+    seeds = np.random.randint(2**31, size=len(names)).tolist()
+
+    # --- Run each balancer once over all task steps ---
+    print(f"...Simulating for {', '.join(map(str, task_counts))} tasks (one incremental pass per algorithm)...")
+    with ProcessPoolExecutor(max_workers=len(names)) if parallel else contextlib.nullcontext() as pool:
+        run = pool.map if pool else map
+        runs = run(
+            _simulate_sweep,
+            [balancers[name] for name in names],
+            [all_tasks] * len(names),
+            [task_counts] * len(names),
+            seeds,
+        )
 
-    # --- Run simulation for each task step ---
-    for task_count in params['TASK_STEPS']:
-        print(f"...Simulating for {task_count} tasks...")
-        
-        tasks_subset = all_tasks[:task_count]
-        
-        # Run simulations (SimPy-based)
-        rr_finish_times = _simulate_with_simpy(rr_balancer, tasks_subset, vms, log_tasks=False)
-        rho_finish_times = _simulate_with_simpy(rho_balancer, tasks_subset, vms, log_tasks=False)
-        aco_finish_times = _simulate_with_simpy(aco_balancer, tasks_subset, vms, log_tasks=False)
-        
-        # Calculate metrics
-        metrics_rr = metrics.calculate_metrics(rr_balancer, rr_finish_times, task_count)
-        metrics_rho = metrics.calculate_metrics(rho_balancer, rho_finish_times, task_count)
-        metrics_aco = metrics.calculate_metrics(aco_balancer, aco_finish_times, task_count)
-        
-        # Store results
-        experiment_results[task_count] = {
-            "Round Robin": metrics_rr,
-            "RHO": metrics_rho,
-            "ACO": metrics_aco
-        }
+        # Store results (and the balancers' end state, for their logs)
+        for name, (step_results, balancer) in zip(names, runs):
+            balancers[name] = balancer
+            for task_count, (finish_times, step_metrics) in zip(task_counts, step_results):
+                experiment_results[task_count][name] = step_metrics
+            # The largest step is the final run; its logs cover its first tasks
+            final_times[name] = step_results[-1][0]
     
     print("--- EXPERIMENT COMPLETE ---")
     
     # --- Process Final Run (Max Tasks) ---
-    print(f"\nProcessing results for max tasks ({params['TASK_STEPS'][-1]})...")
+    print(f"\nProcessing results for max tasks ({max_tasks})...")
     
-    # We re-run the final simulation with logging enabled
-    tasks_final = all_tasks[:params['TASK_STEPS'][-1]]
-    
-    final_times = {
-        "Round Robin": _simulate_with_simpy(rr_balancer, tasks_final, vms, log_tasks=True),
-        "RHO": _simulate_with_simpy(rho_balancer, tasks_final, vms, log_tasks=True),
-        "ACO": _simulate_with_simpy(aco_balancer, tasks_final, vms, log_tasks=True)
-    }
-    
-    final_metrics = {
-        "Round Robin": metrics.calculate_metrics(rr_balancer, final_times["Round Robin"], params['TASK_STEPS'][-1]),
-        "RHO": metrics.calculate_metrics(rho_balancer, final_times["RHO"], params['TASK_STEPS'][-1]),
-        "ACO": metrics.calculate_metrics(aco_balancer, final_times["ACO"], params['TASK_STEPS'][-1])
-    }
+    # The final run is the largest task step (simulated with logging above)
+    final_metrics = experiment_results[max_tasks]
     
     return experiment_results, final_metrics, final_times, balancers
\ No newline at end of file